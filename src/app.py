@@ -25,55 +25,55 @@ activities = {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Join the team for practice and games",
         "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Soccer Club": {
         "description": "Practice soccer skills and compete in matches",
         "schedule": "Mondays and Wednesdays, 3:00 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Art Club": {
         "description": "Explore various art techniques and create projects",
         "schedule": "Fridays, 3:00 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     },
     "Drama Club": {
         "description": "Participate in theater productions and improv",
         "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": []
+        "participants": set()
     },
     "Debate Team": {
         "description": "Engage in debates and improve public speaking skills",
         "schedule": "Wednesdays, 4:00 PM - 6:00 PM",
         "max_participants": 12,
-        "participants": []
+        "participants": set()
     },
     "Science Club": {
         "description": "Conduct experiments and explore scientific concepts",
         "schedule": "Thursdays, 3:00 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": []
+        "participants": set()
     }
 }
 
@@ -85,7 +85,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Participants are stored as sets; JSON has no set type, so serialize as lists
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -104,7 +108,7 @@ def signup_for_activity(activity_name: str, email: str):
     
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 @app.delete("/activities/{activity_name}/unregister")
@@ -1,86 +1,148 @@
-"""Pytest configuration and fixtures for FastAPI tests."""
-import sys
-from pathlib import Path
+"""Pytest configuration and fixtures for FastAPI tests.
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+``app.activities`` is a mutable module-level dict shared by every test in the
+session. The autouse ``reset_activities`` fixture undoes each test's changes to
+it, and nothing may reload the ``app`` module, which would rebuild
+``activities`` and leave these fixtures holding the old dict.
+"""
+import sys
 
 import pytest
-from fastapi.testclient import TestClient
-from app import app, activities
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def _app_imported_once():
+    """Fail the session if the app module was reloaded or replaced."""
+    from app import activities
+
+    yield
+    assert sys.modules["app"].activities is activities, "app module was reloaded"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_responses():
+    """Decode response bodies with orjson instead of the stdlib json module."""
+    import httpx
+    import orjson
+
+    stdlib_json = httpx.Response.json
+
+    def json(self, **kwargs):
+        if kwargs:
+            return stdlib_json(self, **kwargs)
+        try:
+            return orjson.loads(self.content)
+        except orjson.JSONDecodeError:
+            # Let httpx detect BOM-less UTF-16/32 bodies and raise its usual errors
+            return stdlib_json(self)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(httpx.Response, "json", json)
+        yield
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Provide a test client for the FastAPI application."""
-    return TestClient(app)
+    """Provide a test client for the FastAPI application.
+
+    Entering the client runs lifespan startup and opens its event loop portal
+    once, and both are shut down when the session ends.
+    """
+    from fastapi.testclient import TestClient
+
+    from app import app
+
+    with TestClient(app) as c:
+        yield c
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before and after each test."""
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Join the team for practice and games",
-            "schedule": "Tuesdays and Thursdays, 4:30 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Soccer Club": {
-            "description": "Practice soccer skills and compete in matches",
-            "schedule": "Mondays and Wednesdays, 3:00 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Art Club": {
-            "description": "Explore various art techniques and create projects",
-            "schedule": "Fridays, 3:00 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Drama Club": {
-            "description": "Participate in theater productions and improv",
-            "schedule": "Tuesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Debate Team": {
-            "description": "Engage in debates and improve public speaking skills",
-            "schedule": "Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 12,
-            "participants": []
-        },
-        "Science Club": {
-            "description": "Conduct experiments and explore scientific concepts",
-            "schedule": "Thursdays, 3:00 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": []
-        }
-    }
-    
-    # Store original state
-    original_state = {k: {"participants": v["participants"].copy()} for k, v in activities.items()}
-    
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient(anyio_backend):
+    """Provide an async client for issuing concurrent requests in one test."""
+    import httpx
+
+    from app import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+class _TrackedSet(set):
+    """Participant set that records its activity name in a write log when mutated."""
+
+    def __init__(self, iterable, name, write_log):
+        super().__init__(iterable)
+        self.name = name
+        self.write_log = write_log
+
+    def __reduce__(self):
+        # Copy and pickle as a plain set; the write log is test-only state
+        return set, (list(self),)
+
+    def _tracked(method):
+        def wrapper(self, *args, **kwargs):
+            self.write_log.add(self.name)
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    add = _tracked(set.add)
+    remove = _tracked(set.remove)
+    discard = _tracked(set.discard)
+    pop = _tracked(set.pop)
+    clear = _tracked(set.clear)
+    update = _tracked(set.update)
+    difference_update = _tracked(set.difference_update)
+    intersection_update = _tracked(set.intersection_update)
+    symmetric_difference_update = _tracked(set.symmetric_difference_update)
+    __ior__ = _tracked(set.__ior__)
+    __iand__ = _tracked(set.__iand__)
+    __isub__ = _tracked(set.__isub__)
+    __ixor__ = _tracked(set.__ixor__)
+
+    del _tracked
+
+
+@pytest.fixture(scope="session")
+def _pristine():
+    """Snapshot each activity's initial participants once per session."""
+    from app import activities
+
+    return {name: frozenset(data["participants"]) for name, data in activities.items()}
+
+
+@pytest.fixture(scope="session")
+def _write_log(_pristine):
+    """Swap participant sets for tracked ones for the session and yield the write log."""
+    from app import activities
+
+    write_log = set()
+    for activity_name, activity in activities.items():
+        activity["participants"] = _TrackedSet(
+            activity["participants"], activity_name, write_log
+        )
+    yield write_log
+
+    for activity in activities.values():
+        activity["participants"] = set(activity["participants"])
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(_pristine, _write_log):
+    """Restore the participants of activities modified by each test."""
+    from app import activities
+
     yield
-    
-    # Restore original state
-    for activity_name, original_data in original_state.items():
-        activities[activity_name]["participants"] = original_data["participants"].copy()
+
+    for activity_name in _write_log:
+        participants = activities[activity_name]["participants"]
+        set.clear(participants)
+        set.update(participants, _pristine[activity_name])
+    _write_log.clear()
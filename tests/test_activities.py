@@ -1,189 +1,173 @@
 """Test cases for FastAPI activities management application."""
+import asyncio
+
 import pytest
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+ACTIVITIES = "/activities"
+BASKETBALL_SIGNUP = "/activities/Basketball Team/signup"
+BASKETBALL_UNREGISTER = "/activities/Basketball Team/unregister"
+SOCCER_SIGNUP = "/activities/Soccer Club/signup"
+CHESS_SIGNUP = "/activities/Chess Club/signup"
+CHESS_UNREGISTER = "/activities/Chess Club/unregister"
+NONEXISTENT_SIGNUP = "/activities/NonExistent Activity/signup"
+NONEXISTENT_UNREGISTER = "/activities/NonExistent Activity/unregister"
+
+NEW_STUDENT = "newstudent@mergington.edu"
+MICHAEL = "michael@mergington.edu"  # Already in Chess Club
+
+EXPECTED_ACTIVITIES = [
+    "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
+    "Soccer Club", "Art Club", "Drama Club", "Debate Team", "Science Club"
+]
+
+
+class ActivitySchema(BaseModel):
+    """Expected shape of a single activity in the GET /activities payload."""
+    model_config = ConfigDict(strict=True)
+
+    description: str
+    schedule: str
+    max_participants: int
+    participants: list[str]
+
+
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """Fetch GET /activities once per test class."""
+    return client.get(ACTIVITIES)
+
+
+@pytest.fixture(scope="class")
+def activities_payload(activities_response):
+    """Decode the shared GET /activities response once per test class."""
+    return activities_response.json()
 
 
 class TestGetActivities:
     """Tests for retrieving activities."""
     
-    def test_get_activities_returns_200(self, client):
+    def test_get_activities_returns_200(self, activities_response):
         """Test that GET /activities returns a 200 status code."""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
     
-    def test_get_activities_returns_dict(self, client):
+    def test_get_activities_returns_dict(self, activities_payload):
         """Test that GET /activities returns a dictionary."""
-        response = client.get("/activities")
-        assert isinstance(response.json(), dict)
+        assert isinstance(activities_payload, dict)
     
-    def test_get_activities_contains_expected_activities(self, client):
+    def test_get_activities_contains_expected_activities(self, activities_payload):
         """Test that response contains expected activity names."""
-        response = client.get("/activities")
-        activities = response.json()
-        expected_activities = [
-            "Chess Club", "Programming Class", "Gym Class", "Basketball Team",
-            "Soccer Club", "Art Club", "Drama Club", "Debate Team", "Science Club"
-        ]
-        for activity in expected_activities:
-            assert activity in activities
-    
-    def test_activity_has_required_fields(self, client):
-        """Test that each activity has all required fields."""
-        response = client.get("/activities")
-        activities = response.json()
-        required_fields = ["description", "schedule", "max_participants", "participants"]
-        
-        for activity_name, activity_data in activities.items():
-            for field in required_fields:
-                assert field in activity_data, f"{activity_name} missing {field}"
+        for activity in EXPECTED_ACTIVITIES:
+            assert activity in activities_payload
     
-    def test_participants_is_list(self, client):
-        """Test that participants field is a list."""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
-            assert isinstance(activity_data["participants"], list), \
-                f"{activity_name} participants should be a list"
-    
-    def test_max_participants_is_integer(self, client):
-        """Test that max_participants field is an integer."""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
-            assert isinstance(activity_data["max_participants"], int), \
-                f"{activity_name} max_participants should be an integer"
+    def test_activity_field_types(self, activities_payload):
+        """Test that every activity has the required fields with the expected types."""
+        TypeAdapter(dict[str, ActivitySchema]).validate_python(activities_payload)
 
 
 class TestSignupForActivity:
     """Tests for signing up for activities."""
     
-    def test_signup_new_student_returns_200(self, client, reset_activities):
+    def test_signup_new_student_returns_200(self, client):
         """Test that signing up a new student returns 200."""
-        response = client.post(
-            "/activities/Basketball%20Team/signup?email=newstudent@mergington.edu"
-        )
+        response = client.post(BASKETBALL_SIGNUP, params={"email": NEW_STUDENT})
         assert response.status_code == 200
     
-    def test_signup_new_student_returns_success_message(self, client, reset_activities):
+    def test_signup_new_student_returns_success_message(self, client):
         """Test that signup returns appropriate success message."""
-        response = client.post(
-            "/activities/Basketball%20Team/signup?email=newstudent@mergington.edu"
-        )
+        response = client.post(BASKETBALL_SIGNUP, params={"email": NEW_STUDENT})
         data = response.json()
         assert "message" in data
         assert "Signed up" in data["message"]
-        assert "newstudent@mergington.edu" in data["message"]
+        assert NEW_STUDENT in data["message"]
     
-    def test_signup_adds_participant(self, client, reset_activities):
+    def test_signup_adds_participant(self, client):
         """Test that signup adds participant to activity."""
-        email = "newstudent@mergington.edu"
-        client.post(f"/activities/Basketball%20Team/signup?email={email}")
+        client.post(BASKETBALL_SIGNUP, params={"email": NEW_STUDENT})
         
-        response = client.get("/activities")
+        response = client.get(ACTIVITIES)
         activities = response.json()
-        assert email in activities["Basketball Team"]["participants"]
+        assert NEW_STUDENT in activities["Basketball Team"]["participants"]
     
     def test_signup_nonexistent_activity_returns_404(self, client):
         """Test that signup for non-existent activity returns 404."""
         response = client.post(
-            "/activities/NonExistent%20Activity/signup?email=student@mergington.edu"
+            NONEXISTENT_SIGNUP, params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
-    def test_signup_duplicate_email_returns_400(self, client, reset_activities):
+    def test_signup_duplicate_email_returns_400(self, client):
         """Test that signing up duplicate email returns 400."""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(
-            f"/activities/Chess%20Club/signup?email={email}"
-        )
+        response = client.post(CHESS_SIGNUP, params={"email": MICHAEL})
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
     
-    def test_signup_same_student_different_activities(self, client, reset_activities):
+    @pytest.mark.anyio
+    async def test_signup_same_student_different_activities(self, aclient):
         """Test that a student can sign up for multiple different activities."""
-        email = "newstudent@mergington.edu"
-        
-        # Sign up for two different activities
-        response1 = client.post(
-            f"/activities/Basketball%20Team/signup?email={email}"
-        )
-        response2 = client.post(
-            f"/activities/Soccer%20Club/signup?email={email}"
+        # Sign up for two different activities concurrently
+        response1, response2 = await asyncio.gather(
+            aclient.post(BASKETBALL_SIGNUP, params={"email": NEW_STUDENT}),
+            aclient.post(SOCCER_SIGNUP, params={"email": NEW_STUDENT}),
         )
         
         assert response1.status_code == 200
         assert response2.status_code == 200
         
         # Verify in both activities
-        activities = client.get("/activities").json()
-        assert email in activities["Basketball Team"]["participants"]
-        assert email in activities["Soccer Club"]["participants"]
+        activities = (await aclient.get(ACTIVITIES)).json()
+        assert NEW_STUDENT in activities["Basketball Team"]["participants"]
+        assert NEW_STUDENT in activities["Soccer Club"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for unregistering from activities."""
     
-    def test_unregister_existing_participant_returns_200(self, client, reset_activities):
+    def test_unregister_existing_participant_returns_200(self, client):
         """Test that unregistering an existing participant returns 200."""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response = client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         assert response.status_code == 200
     
-    def test_unregister_returns_success_message(self, client, reset_activities):
+    def test_unregister_returns_success_message(self, client):
         """Test that unregister returns appropriate success message."""
-        email = "michael@mergington.edu"
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response = client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         data = response.json()
         assert "message" in data
         assert "Unregistered" in data["message"]
-        assert email in data["message"]
+        assert MICHAEL in data["message"]
     
-    def test_unregister_removes_participant(self, client, reset_activities):
+    def test_unregister_removes_participant(self, client):
         """Test that unregister removes participant from activity."""
-        email = "michael@mergington.edu"
-        client.delete(f"/activities/Chess%20Club/unregister?email={email}")
+        client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         
-        response = client.get("/activities")
+        response = client.get(ACTIVITIES)
         activities = response.json()
-        assert email not in activities["Chess Club"]["participants"]
+        assert MICHAEL not in activities["Chess Club"]["participants"]
     
     def test_unregister_nonexistent_activity_returns_404(self, client):
         """Test that unregister from non-existent activity returns 404."""
         response = client.delete(
-            "/activities/NonExistent%20Activity/unregister?email=student@mergington.edu"
+            NONEXISTENT_UNREGISTER, params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
-    def test_unregister_non_participant_returns_400(self, client, reset_activities):
+    def test_unregister_non_participant_returns_400(self, client):
         """Test that unregistering non-participant returns 400."""
         email = "notregistered@mergington.edu"
-        response = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response = client.delete(CHESS_UNREGISTER, params={"email": email})
         assert response.status_code == 400
         assert "not registered" in response.json()["detail"]
     
-    def test_unregister_multiple_times_fails_second_time(self, client, reset_activities):
+    def test_unregister_multiple_times_fails_second_time(self, client):
         """Test that unregistering the same participant twice fails on second attempt."""
-        email = "michael@mergington.edu"
-        
         # First unregister should succeed
-        response1 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response1 = client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         assert response1.status_code == 200
         
         # Second unregister should fail
-        response2 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response2 = client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         assert response2.status_code == 400
         assert "not registered" in response2.json()["detail"]
 
@@ -191,50 +175,38 @@ class TestUnregisterFromActivity:
 class TestSignupAndUnregisterInteraction:
     """Tests for interactions between signup and unregister."""
     
-    def test_signup_then_unregister(self, client, reset_activities):
+    def test_signup_then_unregister(self, client):
         """Test signing up and then unregistering."""
-        email = "newstudent@mergington.edu"
-        
         # Sign up
-        response1 = client.post(
-            f"/activities/Basketball%20Team/signup?email={email}"
-        )
+        response1 = client.post(BASKETBALL_SIGNUP, params={"email": NEW_STUDENT})
         assert response1.status_code == 200
         
         # Verify signup worked
-        activities = client.get("/activities").json()
-        assert email in activities["Basketball Team"]["participants"]
+        activities = client.get(ACTIVITIES).json()
+        assert NEW_STUDENT in activities["Basketball Team"]["participants"]
         
         # Unregister
-        response2 = client.delete(
-            f"/activities/Basketball%20Team/unregister?email={email}"
-        )
+        response2 = client.delete(BASKETBALL_UNREGISTER, params={"email": NEW_STUDENT})
         assert response2.status_code == 200
         
         # Verify unregister worked
-        activities = client.get("/activities").json()
-        assert email not in activities["Basketball Team"]["participants"]
+        activities = client.get(ACTIVITIES).json()
+        assert NEW_STUDENT not in activities["Basketball Team"]["participants"]
     
-    def test_unregister_then_signup_again(self, client, reset_activities):
+    def test_unregister_then_signup_again(self, client):
         """Test unregistering and then signing up again."""
-        email = "michael@mergington.edu"
-        
         # Unregister
-        response1 = client.delete(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        response1 = client.delete(CHESS_UNREGISTER, params={"email": MICHAEL})
         assert response1.status_code == 200
         
         # Verify unregister worked
-        activities = client.get("/activities").json()
-        assert email not in activities["Chess Club"]["participants"]
+        activities = client.get(ACTIVITIES).json()
+        assert MICHAEL not in activities["Chess Club"]["participants"]
         
         # Sign up again
-        response2 = client.post(
-            f"/activities/Chess%20Club/signup?email={email}"
-        )
+        response2 = client.post(CHESS_SIGNUP, params={"email": MICHAEL})
         assert response2.status_code == 200
         
         # Verify signup worked
-        activities = client.get("/activities").json()
-        assert email in activities["Chess Club"]["participants"]
+        activities = client.get(ACTIVITIES).json()
+        assert MICHAEL in activities["Chess Club"]["participants"]